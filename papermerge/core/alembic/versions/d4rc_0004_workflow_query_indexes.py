@@ -0,0 +1,24 @@
+# (c) Copyright Datacraft, 2026
+"""Workflow query indexes.
+
+Revision ID: d4rc_0004
+Revises: d4rc_0003
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = 'd4rc_0004'
+down_revision: Union[str, None] = 'd4rc_0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+	# Pending-task inbox: WHERE assigned_to = :user AND status = 'pending'
+	op.create_index('idx_step_executions_assignee', 'workflow_step_executions', ['assigned_to', 'status'])
+
+
+def downgrade() -> None:
+	op.drop_index('idx_step_executions_assignee', table_name='workflow_step_executions')
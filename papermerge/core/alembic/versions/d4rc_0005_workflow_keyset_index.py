@@ -0,0 +1,25 @@
+# (c) Copyright Datacraft, 2026
+"""Index for keyset pagination of workflows.
+
+Revision ID: d4rc_0005
+Revises: d4rc_0004
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = 'd4rc_0005'
+down_revision: Union[str, None] = 'd4rc_0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+	# list_workflows: WHERE is_active AND (created_at, id) < (:cursor, :cursor_id)
+	# ORDER BY created_at DESC, id DESC
+	op.create_index('idx_workflows_active_created', 'workflows', ['is_active', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+	op.drop_index('idx_workflows_active_created', table_name='workflows')
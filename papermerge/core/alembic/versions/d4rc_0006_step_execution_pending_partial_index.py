@@ -0,0 +1,35 @@
+# (c) Copyright Datacraft, 2026
+"""Partial index for the overdue step execution scan.
+
+Revision ID: d4rc_0006
+Revises: d4rc_0005
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'd4rc_0006'
+down_revision: Union[str, None] = 'd4rc_0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+	# check_deadlines: WHERE status = 'pending' AND deadline_at < now()
+	# Completed executions dominate the table and never match, so keep
+	# them out of the index entirely.
+	op.drop_index('idx_step_executions_pending', table_name='workflow_step_executions')
+	op.create_index(
+		'idx_step_executions_pending', 'workflow_step_executions', ['deadline_at'],
+		postgresql_where=sa.text("status = 'pending' AND deadline_at IS NOT NULL"),
+	)
+
+
+def downgrade() -> None:
+	op.drop_index(
+		'idx_step_executions_pending', table_name='workflow_step_executions',
+		postgresql_where=sa.text("status = 'pending' AND deadline_at IS NOT NULL"),
+	)
+	op.create_index('idx_step_executions_pending', 'workflow_step_executions', ['status', 'deadline_at'])
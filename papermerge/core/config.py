@@ -10,6 +10,10 @@ class Settings(BaseSettings):
     db_url: PostgresDsn
     # Connect to DB via SSL
     db_ssl: bool = False
+    # Async engine connection pool; 0 keeps NullPool (a fresh connection
+    # per session), which is what Celery's per-task event loops need
+    db_pool_size: int = Field(ge=0, default=0)
+    db_max_overflow: int = Field(ge=0, default=10)
     log_config: Path | None = Path("/app/log_config.yaml")
     api_prefix: str = ''
     default_lang: DocumentLang = DocumentLang.deu
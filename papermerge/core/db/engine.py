@@ -12,10 +12,19 @@ connect_args = {}
 if settings.db_ssl:
     connect_args["ssl"] = "require"
 
+if settings.db_pool_size:
+    pool_args = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+    }
+else:
+    pool_args = {"poolclass": NullPool}
+
 engine = create_async_engine(
     settings.async_db_url,
-    poolclass=NullPool,
-    connect_args=connect_args
+    connect_args=connect_args,
+    **pool_args,
 )
 
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
@@ -10,6 +10,7 @@ Analyzes scanned documents for quality metrics including:
 - Noise levels
 - OCR confidence
 """
+import io
 import logging
 import math
 from dataclasses import dataclass, field
@@ -183,6 +184,55 @@ class QualityAssessor:
 
 		return metrics
 
+	def assess_bytes(
+		self,
+		image_bytes: bytes,
+		ocr_confidence: float | None = None,
+	) -> QualityMetrics:
+		"""
+		Assess quality of an encoded image held in memory.
+
+		Decodes straight from the buffer, so uploads and storage downloads
+		do not need to be written to a temporary file first.
+
+		Args:
+			image_bytes: Encoded image (PNG, JPEG, TIFF, ...)
+			ocr_confidence: Optional pre-computed OCR confidence
+
+		Returns:
+			QualityMetrics with all measurements and issues
+		"""
+		try:
+			import cv2
+			from PIL import Image, UnidentifiedImageError
+		except ImportError:
+			logger.warning("OpenCV/PIL not available, returning basic metrics")
+			return QualityMetrics()
+
+		img = cv2.imdecode(np.frombuffer(image_bytes, dtype=np.uint8), cv2.IMREAD_COLOR)
+		if img is None:
+			metrics = QualityMetrics()
+			metrics.file_size_bytes = len(image_bytes)
+			metrics.issues.append(QualityIssue(
+				metric="file_read",
+				actual_value=0,
+				expected_value=1,
+				severity="critical",
+				message="Failed to decode image data",
+			))
+			return metrics
+
+		# OpenCV decodes some formats PIL cannot identify; assume 72 DPI then
+		try:
+			with Image.open(io.BytesIO(image_bytes)) as pil_img:
+				dpi = pil_img.info.get("dpi", (72, 72))
+		except UnidentifiedImageError:
+			dpi = (72, 72)
+
+		metrics = self.assess_from_array(img, int(min(dpi[0], dpi[1])), ocr_confidence)
+		metrics.file_size_bytes = len(image_bytes)
+		return metrics
+
 	def assess_from_array(
 		self,
 		image_array: np.ndarray,
@@ -520,6 +520,7 @@ async def assess_with_vlm(
 		result = await assessor.assess_from_bytes(
 			base64.b64decode(request.image_base64),
 			request.mime_type or "image/jpeg",
+			include_traditional=request.include_traditional,
 		)
 	else:
 		raise HTTPException(status_code=400, detail="Either image_path or image_base64 is required")
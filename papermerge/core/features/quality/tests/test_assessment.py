@@ -0,0 +1,53 @@
+# (c) Copyright Datacraft, 2026
+import io
+
+import pytest
+
+# numpy and OpenCV are not in the dev dependency group
+pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+pytest.importorskip("PIL")
+
+from PIL import Image, UnidentifiedImageError
+
+from papermerge.core.features.quality.assessment import QualityAssessor
+
+
+# PNG stores pixels per metre; 254 DPI round-trips exactly
+def _png(width: int = 40, height: int = 30, dpi: int = 254) -> bytes:
+	buf = io.BytesIO()
+	Image.new("RGB", (width, height), "white").save(buf, "PNG", dpi=(dpi, dpi))
+	return buf.getvalue()
+
+
+def test_assess_bytes_png():
+	data = _png()
+
+	metrics = QualityAssessor().assess_bytes(data)
+
+	assert (metrics.width_px, metrics.height_px) == (40, 30)
+	assert metrics.resolution_dpi == 254
+	assert metrics.file_size_bytes == len(data)
+	assert not any(issue.metric == "file_read" for issue in metrics.issues)
+
+
+def test_assess_bytes_undecodable():
+	data = b"not an image"
+
+	metrics = QualityAssessor().assess_bytes(data)
+
+	assert metrics.file_size_bytes == len(data)
+	assert [issue.metric for issue in metrics.issues] == ["file_read"]
+
+
+def test_assess_bytes_falls_back_to_72_dpi(monkeypatch):
+	def unidentified(*args, **kwargs):
+		raise UnidentifiedImageError("cannot identify image file")
+
+	# Formats OpenCV can decode but PIL cannot identify
+	monkeypatch.setattr(Image, "open", unidentified)
+
+	metrics = QualityAssessor().assess_bytes(_png())
+
+	assert metrics.resolution_dpi == 72
+	assert (metrics.width_px, metrics.height_px) == (40, 30)
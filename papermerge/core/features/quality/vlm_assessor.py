@@ -5,6 +5,7 @@ VLM-powered document quality assessment using Qwen-VL.
 Provides intelligent quality analysis using vision-language models
 for deeper understanding of document content and issues.
 """
+import asyncio
 import base64
 import json
 import logging
@@ -14,7 +15,13 @@ from typing import Any
 
 import httpx
 
-from .assessment import QualityMetrics, QualityIssue, QualityGrade
+from .assessment import (
+	QualityAssessor,
+	QualityMetrics,
+	QualityIssue,
+	QualityGrade,
+	assess_document_quality,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -110,40 +117,61 @@ class VLMQualityAssessor:
 		mime_map = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png", ".tiff": "image/tiff", ".tif": "image/tiff"}
 		mime_type = mime_map.get(suffix, "image/jpeg")
 
-		# Call VLM
-		vlm_result = await self._call_vlm(image_base64, mime_type)
-
-		# Optionally combine with traditional assessment
-		if include_traditional:
-			from .assessment import assess_document_quality
-			traditional = assess_document_quality(path)
-			vlm_result["traditional_metrics"] = {
-				"resolution_dpi": traditional.resolution_dpi,
-				"skew_angle": traditional.skew_angle,
-				"brightness": traditional.brightness,
-				"contrast": traditional.contrast,
-				"sharpness": traditional.sharpness,
-				"noise_level": traditional.noise_level,
-				"traditional_score": traditional.quality_score,
-				"traditional_grade": traditional.grade.value,
-			}
-			# Blend scores
-			if vlm_result.get("overall_quality_score") and traditional.quality_score:
-				vlm_result["blended_score"] = (
-					vlm_result["overall_quality_score"] * 0.6 +
-					traditional.quality_score * 0.4
-				)
+		if not include_traditional:
+			return await self._call_vlm(image_base64, mime_type)
 
-		return vlm_result
+		# Combine with traditional assessment. The OpenCV analysis is
+		# CPU-bound, so it runs in a worker thread while the VLM request is
+		# in flight instead of blocking the event loop afterwards.
+		vlm_result, traditional = await asyncio.gather(
+			self._call_vlm(image_base64, mime_type),
+			asyncio.to_thread(assess_document_quality, path),
+		)
+		return self._merge_traditional(vlm_result, traditional)
 
 	async def assess_from_bytes(
 		self,
 		image_bytes: bytes,
 		mime_type: str = "image/jpeg",
+		include_traditional: bool = True,
 	) -> dict[str, Any]:
 		"""Assess quality from image bytes."""
 		image_base64 = base64.b64encode(image_bytes).decode("utf-8")
-		return await self._call_vlm(image_base64, mime_type)
+		if not include_traditional:
+			return await self._call_vlm(image_base64, mime_type)
+
+		# Decode and analyse the buffer in a worker thread while the VLM
+		# request is in flight
+		vlm_result, traditional = await asyncio.gather(
+			self._call_vlm(image_base64, mime_type),
+			asyncio.to_thread(QualityAssessor().assess_bytes, image_bytes),
+		)
+		return self._merge_traditional(vlm_result, traditional)
+
+	def _merge_traditional(
+		self,
+		vlm_result: dict[str, Any],
+		traditional: QualityMetrics,
+	) -> dict[str, Any]:
+		"""Attach traditional CV metrics and a blended score to a VLM result."""
+		vlm_result["traditional_metrics"] = {
+			"resolution_dpi": traditional.resolution_dpi,
+			"skew_angle": traditional.skew_angle,
+			"brightness": traditional.brightness,
+			"contrast": traditional.contrast,
+			"sharpness": traditional.sharpness,
+			"noise_level": traditional.noise_level,
+			"traditional_score": traditional.quality_score,
+			"traditional_grade": traditional.grade.value,
+		}
+		# Blend scores
+		if vlm_result.get("overall_quality_score") and traditional.quality_score:
+			vlm_result["blended_score"] = (
+				vlm_result["overall_quality_score"] * 0.6 +
+				traditional.quality_score * 0.4
+			)
+
+		return vlm_result
 
 	async def _call_vlm(
 		self,
@@ -5,7 +5,7 @@ from datetime import datetime
 from uuid import UUID
 from enum import Enum
 
-from sqlalchemy import String, ForeignKey, Integer, Boolean, Text, func, Index
+from sqlalchemy import String, ForeignKey, Integer, Boolean, Text, func, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import TIMESTAMP, JSONB, ARRAY
 
@@ -110,6 +110,7 @@ class Workflow(Base):
 
 	__table_args__ = (
 		Index("idx_workflows_tenant_active", "tenant_id", "is_active"),
+		Index("idx_workflows_active_created", "is_active", "created_at", "id"),
 	)
 
 
@@ -184,7 +185,9 @@ class WorkflowInstance(Base):
 	initiated_by: Mapped[UUID | None] = mapped_column(
 		ForeignKey("users.id", ondelete="SET NULL")
 	)
-	context: Mapped[dict | None] = mapped_column(JSONB)
+	# Deferred: only written server-side on the hot paths, never needed for
+	# status reads
+	context: Mapped[dict | None] = mapped_column(JSONB, deferred=True)
 
 	# Relationships
 	workflow: Mapped["Workflow"] = relationship("Workflow", back_populates="instances")
@@ -244,5 +247,9 @@ class WorkflowStepExecution(Base):
 	)
 
 	__table_args__ = (
-		Index("idx_step_executions_pending", "status", "deadline_at"),
+		Index(
+			"idx_step_executions_pending", "deadline_at",
+			postgresql_where=text("status = 'pending' AND deadline_at IS NOT NULL"),
+		),
+		Index("idx_step_executions_assignee", "assigned_to", "status"),
 	)
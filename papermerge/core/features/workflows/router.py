@@ -1,16 +1,21 @@
 # (c) Copyright Datacraft, 2026
 """Workflow management API endpoints."""
 import logging
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Response, status
+from pydantic import BaseModel
+from sqlalchemy import select, insert, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload, selectinload
 
 from papermerge.core.db.engine import get_db
 from papermerge.core.features.auth.dependencies import require_scopes
 from papermerge.core.features.auth import scopes
 from papermerge.core.services.workflow_engine import WorkflowEngine
 from . import schema
+from .db.orm import Workflow, WorkflowStep, StepType
 
 router = APIRouter(
 	prefix="/workflows",
@@ -19,102 +24,180 @@ router = APIRouter(
 
 logger = logging.getLogger(__name__)
 
+# One dependency object per scope, shared by every endpoint that needs it
+_DEP_VIEW = require_scopes(scopes.NODE_VIEW)
+_DEP_CREATE = require_scopes(scopes.NODE_CREATE)
+_DEP_UPDATE = require_scopes(scopes.NODE_UPDATE)
+_DEP_DELETE = require_scopes(scopes.NODE_DELETE)
 
-@router.get("/")
+
+def _json_response(model: BaseModel) -> Response:
+	"""Serialize with pydantic-core and skip FastAPI's response validation.
+
+	The declared ``response_model`` still documents the endpoint; returning a
+	``Response`` makes FastAPI send it as-is.
+	"""
+	return Response(model.model_dump_json(), media_type="application/json")
+
+
+@router.get("/", response_model=schema.WorkflowListResponse)
 async def list_workflows(
-	user: require_scopes(scopes.NODE_VIEW),
+	user: _DEP_VIEW,
 	db_session: AsyncSession = Depends(get_db),
 	page: int = 1,
 	page_size: int = 20,
-) -> schema.WorkflowListResponse:
-	"""List available workflows."""
-	from sqlalchemy import select, func
-	from .db.orm import Workflow
-
-	offset = (page - 1) * page_size
-
-	# Get total count
-	count_stmt = select(func.count()).select_from(Workflow).where(
+	cursor: datetime | None = None,
+	cursor_id: UUID | None = None,
+	count: bool = True,
+) -> Response:
+	"""List available workflows, newest first.
+
+	Pass the previous page's ``next_cursor``/``next_cursor_id`` as
+	``cursor``/``cursor_id`` to seek past it instead of using ``page``.
+	``total`` is only computed for ``page`` requests with ``count=true``;
+	cursor pages and ``count=false`` return ``total=None`` and derive
+	``has_more`` by over-fetching a single row.
+	"""
+	if (cursor is None) != (cursor_id is None):
+		raise HTTPException(
+			status_code=400,
+			detail="cursor and cursor_id must be given together",
+		)
+	offset = 0 if cursor else (page - 1) * page_size
+	# Under the keyset predicate a window count would only see the rows
+	# after the cursor, so cursor pages do not report a total
+	counted = count and cursor is None
+
+	stmt = select(Workflow).options(
+		# Only the WorkflowInfo columns; skips trigger_conditions JSONB etc.
+		load_only(
+			Workflow.id,
+			Workflow.name,
+			Workflow.description,
+			Workflow.is_active,
+			Workflow.created_at,
+		),
+		raiseload("*"),
+	).where(
 		Workflow.is_active == True
 	)
-	total = await db_session.scalar(count_stmt)
-
-	# Get workflows
-	stmt = select(Workflow).where(
-		Workflow.is_active == True
-	).offset(offset).limit(page_size)
-	result = await db_session.execute(stmt)
-	workflows = result.scalars().all()
+	if counted:
+		# Total rides along on every row via count(*) OVER (), one round trip
+		stmt = stmt.add_columns(func.count().over().label("total"))
+	if cursor:
+		# created_at is not unique; id breaks ties so no row is skipped
+		stmt = stmt.where(
+			tuple_(Workflow.created_at, Workflow.id) < (cursor, cursor_id)
+		)
+	else:
+		stmt = stmt.offset(offset)
+	stmt = stmt.order_by(Workflow.created_at.desc(), Workflow.id.desc()).limit(
+		page_size if counted else page_size + 1
+	)
 
-	return schema.WorkflowListResponse(
-		items=[schema.WorkflowInfo.model_validate(w) for w in workflows],
+	rows = (await db_session.execute(stmt)).all()
+	if counted:
+		if rows:
+			total = rows[0].total
+		elif offset:
+			# Past the last page there is no row for the window count to
+			# ride on; count separately so total stays correct
+			total = await db_session.scalar(
+				select(func.count()).select_from(Workflow).where(
+					Workflow.is_active == True
+				)
+			)
+		else:
+			total = 0
+		has_more = offset + len(rows) < total
+	else:
+		total = None
+		has_more = len(rows) > page_size
+		rows = rows[:page_size]
+	workflows = [row.Workflow for row in rows]
+	last = workflows[-1] if has_more else None
+
+	return _json_response(schema.WorkflowListResponse.model_construct(
+		items=[schema.from_orm_fast(schema.WorkflowInfo, w) for w in workflows],
 		total=total,
-		page=page,
+		page=None if cursor else page,
 		page_size=page_size,
-	)
+		has_more=has_more,
+		next_cursor=last.created_at if last else None,
+		next_cursor_id=last.id if last else None,
+	))
 
 
-@router.post("/")
+@router.post("/", response_model=schema.WorkflowInfo)
 async def create_workflow(
 	workflow: schema.WorkflowCreate,
-	user: require_scopes(scopes.NODE_CREATE),
+	user: _DEP_CREATE,
 	db_session: AsyncSession = Depends(get_db),
-) -> schema.WorkflowInfo:
+) -> Response:
 	"""Create a new workflow definition."""
-	from .db.orm import Workflow, WorkflowStep
-
-	db_workflow = Workflow(
-		tenant_id=user.tenant_id,
-		name=workflow.name,
-		description=workflow.description,
-		is_active=True,
-		created_by=user.id,
-		updated_by=user.id,
+	# RETURNING brings back id/created_at, so no refresh after commit
+	db_workflow = await db_session.scalar(
+		insert(Workflow).values(
+			tenant_id=user.tenant_id,
+			name=workflow.name,
+			description=workflow.description,
+			is_active=True,
+			created_by=user.id,
+		).returning(Workflow)
 	)
-	db_session.add(db_workflow)
-	await db_session.flush()
-
-	# Add steps
-	for idx, step_data in enumerate(workflow.steps):
-		step = WorkflowStep(
-			workflow_id=db_workflow.id,
-			name=step_data.name,
-			step_order=idx,
-			assignee_type=step_data.assignee_type,
-			assignee_id=step_data.assignee_id,
-			deadline_hours=step_data.deadline_hours,
-		)
-		db_session.add(step)
+
+	# Add steps in one executemany instead of an INSERT per step
+	if workflow.steps:
+		await db_session.execute(insert(WorkflowStep), [
+			{
+				"workflow_id": db_workflow.id,
+				"name": step_data.name,
+				"step_type": StepType.APPROVAL.value,
+				"step_order": idx,
+				"assignee_type": step_data.assignee_type,
+				"assignee_id": step_data.assignee_id,
+				"deadline_hours": step_data.deadline_hours,
+			}
+			for idx, step_data in enumerate(workflow.steps)
+		])
 
 	await db_session.commit()
-	await db_session.refresh(db_workflow)
 
-	return schema.WorkflowInfo.model_validate(db_workflow)
+	return _json_response(schema.from_orm_fast(schema.WorkflowInfo, db_workflow))
 
 
-@router.get("/{workflow_id}")
+@router.get("/{workflow_id}", response_model=schema.WorkflowDetail)
 async def get_workflow(
 	workflow_id: UUID,
-	user: require_scopes(scopes.NODE_VIEW),
+	user: _DEP_VIEW,
 	db_session: AsyncSession = Depends(get_db),
-) -> schema.WorkflowDetail:
+) -> Response:
 	"""Get workflow details with steps."""
-	from .db.orm import Workflow
-
-	workflow = await db_session.get(Workflow, workflow_id)
+	# Steps are loaded up front; any other lazy load raises instead of
+	# silently issuing a query per access
+	stmt = select(Workflow).options(
+		selectinload(Workflow.steps),
+		raiseload("*"),
+	).where(Workflow.id == workflow_id)
+	workflow = await db_session.scalar(stmt)
 	if not workflow:
 		raise HTTPException(status_code=404, detail="Workflow not found")
 
-	return schema.WorkflowDetail.model_validate(workflow)
+	detail = schema.from_orm_fast(schema.WorkflowDetail, workflow)
+	detail.steps = [
+		schema.from_orm_fast(schema.WorkflowStepInfo, step)
+		for step in workflow.steps
+	]
+	return _json_response(detail)
 
 
-@router.post("/{workflow_id}/start")
+@router.post("/{workflow_id}/start", response_model=schema.WorkflowInstanceInfo)
 async def start_workflow(
 	workflow_id: UUID,
 	request: schema.WorkflowStartRequest,
-	user: require_scopes(scopes.NODE_UPDATE),
+	user: _DEP_UPDATE,
 	db_session: AsyncSession = Depends(get_db),
-) -> schema.WorkflowInstanceInfo:
+) -> Response:
 	"""Start a workflow for a document."""
 	engine = WorkflowEngine(db_session)
 
@@ -125,32 +208,51 @@ async def start_workflow(
 			initiated_by=user.id,
 			context=request.context,
 		)
-		return schema.WorkflowInstanceInfo.model_validate(instance)
+		return _json_response(
+			schema.from_orm_fast(schema.WorkflowInstanceInfo, instance)
+		)
 	except ValueError as e:
 		raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/instances/pending")
+@router.get("/instances/pending", response_model=schema.PendingTasksResponse)
 async def get_pending_tasks(
-	user: require_scopes(scopes.NODE_VIEW),
+	user: _DEP_VIEW,
 	db_session: AsyncSession = Depends(get_db),
-) -> schema.PendingTasksResponse:
-	"""Get pending workflow tasks for current user."""
-	engine = WorkflowEngine(db_session)
-	tasks = await engine.get_pending_tasks(user.id)
+	page: int = 1,
+	page_size: int = 20,
+) -> Response:
+	"""Get pending workflow tasks for current user, newest first.
 
-	return schema.PendingTasksResponse(
-		tasks=[schema.PendingTask.model_validate(t) for t in tasks]
+	``has_more`` is derived by over-fetching a single row.
+	"""
+	engine = WorkflowEngine(db_session)
+	tasks = await engine.get_pending_tasks(
+		user.id, limit=page_size + 1, offset=(page - 1) * page_size
 	)
+	has_more = len(tasks) > page_size
 
+	return _json_response(schema.PendingTasksResponse.model_construct(
+		tasks=[
+			schema.from_orm_fast(schema.PendingTask, t)
+			for t in tasks[:page_size]
+		],
+		page=page,
+		page_size=page_size,
+		has_more=has_more,
+	))
 
-@router.post("/instances/{instance_id}/actions")
+
+@router.post(
+	"/instances/{instance_id}/actions",
+	response_model=schema.WorkflowInstanceInfo,
+)
 async def process_workflow_action(
 	instance_id: UUID,
 	action: schema.WorkflowActionRequest,
-	user: require_scopes(scopes.NODE_UPDATE),
+	user: _DEP_UPDATE,
 	db_session: AsyncSession = Depends(get_db),
-) -> schema.WorkflowInstanceInfo:
+) -> Response:
 	"""Process an action on a workflow step."""
 	engine = WorkflowEngine(db_session)
 
@@ -161,18 +263,23 @@ async def process_workflow_action(
 			user_id=user.id,
 			comments=action.comments,
 		)
-		return schema.WorkflowInstanceInfo.model_validate(instance)
+		return _json_response(
+			schema.from_orm_fast(schema.WorkflowInstanceInfo, instance)
+		)
 	except ValueError as e:
 		raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.post("/instances/{instance_id}/cancel")
+@router.post(
+	"/instances/{instance_id}/cancel",
+	response_model=schema.WorkflowInstanceInfo,
+)
 async def cancel_workflow(
 	instance_id: UUID,
 	request: schema.WorkflowCancelRequest,
-	user: require_scopes(scopes.NODE_DELETE),
+	user: _DEP_DELETE,
 	db_session: AsyncSession = Depends(get_db),
-) -> schema.WorkflowInstanceInfo:
+) -> Response:
 	"""Cancel a running workflow."""
 	engine = WorkflowEngine(db_session)
 
@@ -182,6 +289,8 @@ async def cancel_workflow(
 			user_id=user.id,
 			reason=request.reason,
 		)
-		return schema.WorkflowInstanceInfo.model_validate(instance)
+		return _json_response(
+			schema.from_orm_fast(schema.WorkflowInstanceInfo, instance)
+		)
 	except ValueError as e:
 		raise HTTPException(status_code=400, detail=str(e))
@@ -1,8 +1,44 @@
 # (c) Copyright Datacraft, 2026
 """Workflow Pydantic schemas."""
+from functools import cache
+from operator import attrgetter
 from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict
+from sqlalchemy import inspect
+
+_FROM_ATTRS = ConfigDict(from_attributes=True)
+
+
+@cache
+def _row_builder(cls: type[BaseModel], row_type: type):
+	"""Specialize a row -> ``cls`` constructor for one ORM class.
+
+	Field names and the attribute getter are worked out once per (schema,
+	ORM class) pair. Only mapped columns are read; fields the row does not
+	have, and relationships, are left to ``model_construct``'s defaults.
+	"""
+	columns = inspect(row_type).column_attrs.keys()
+	present = tuple(name for name in cls.model_fields if name in columns)
+	getter = attrgetter(*present)
+	if len(present) == 1:
+		# attrgetter returns a bare value rather than a tuple for one name
+		getter = lambda row, _get=getter: (_get(row),)
+	construct = cls.model_construct
+
+	def build(row):
+		return construct(**dict(zip(present, getter(row))))
+
+	return build
+
+
+def from_orm_fast(cls: type[BaseModel], obj) -> BaseModel:
+	"""Build ``cls`` from a trusted ORM row without running validation.
+
+	Only for data read back from the database; request bodies still go
+	through normal validation.
+	"""
+	return _row_builder(cls, type(obj))(obj)
 
 
 class WorkflowStepCreate(BaseModel):
@@ -28,7 +64,7 @@ class WorkflowInfo(BaseModel):
 	is_active: bool
 	created_at: datetime | None = None
 
-	model_config = ConfigDict(from_attributes=True)
+	model_config = _FROM_ATTRS
 
 
 class WorkflowStepInfo(BaseModel):
@@ -40,7 +76,7 @@ class WorkflowStepInfo(BaseModel):
 	assignee_id: UUID | None = None
 	deadline_hours: int | None = None
 
-	model_config = ConfigDict(from_attributes=True)
+	model_config = _FROM_ATTRS
 
 
 class WorkflowDetail(BaseModel):
@@ -52,15 +88,18 @@ class WorkflowDetail(BaseModel):
 	steps: list[WorkflowStepInfo] = []
 	created_at: datetime | None = None
 
-	model_config = ConfigDict(from_attributes=True)
+	model_config = _FROM_ATTRS
 
 
 class WorkflowListResponse(BaseModel):
 	"""Paginated workflow list."""
 	items: list[WorkflowInfo]
-	total: int
-	page: int
+	total: int | None = None  # None when paging by cursor or with count=false
+	page: int | None = None  # None when paging by cursor
 	page_size: int
+	has_more: bool = False
+	next_cursor: datetime | None = None
+	next_cursor_id: UUID | None = None
 
 
 class WorkflowStartRequest(BaseModel):
@@ -78,7 +117,7 @@ class WorkflowInstanceInfo(BaseModel):
 	current_step_id: UUID | None = None
 	created_at: datetime | None = None
 
-	model_config = ConfigDict(from_attributes=True)
+	model_config = _FROM_ATTRS
 
 
 class PendingTask(BaseModel):
@@ -91,12 +130,15 @@ class PendingTask(BaseModel):
 	deadline_at: datetime | None = None
 	started_at: datetime | None = None
 
-	model_config = ConfigDict(from_attributes=True)
+	model_config = _FROM_ATTRS
 
 
 class PendingTasksResponse(BaseModel):
-	"""Response with pending tasks."""
+	"""Page of pending tasks."""
 	tasks: list[PendingTask]
+	page: int = 1
+	page_size: int = 20
+	has_more: bool = False
 
 
 class WorkflowActionRequest(BaseModel):
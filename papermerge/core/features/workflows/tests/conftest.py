@@ -0,0 +1,67 @@
+# (c) Copyright Datacraft, 2026
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from papermerge.core import orm
+from papermerge.core.features.tenants.db.orm import Tenant
+from papermerge.core.features.workflows.db.orm import (
+	Workflow,
+	WorkflowStep,
+	StepType,
+)
+
+
+@pytest.fixture()
+async def tenant(db_session: AsyncSession) -> Tenant:
+	tenant = Tenant(name="Acme", slug=f"acme-{uuid.uuid4().hex[:8]}")
+	db_session.add(tenant)
+	await db_session.flush()
+
+	return tenant
+
+
+@pytest.fixture()
+def make_workflow(db_session: AsyncSession, tenant: Tenant, user: orm.User):
+	async def _maker(
+		name: str = "Invoice approval",
+		steps: int = 1,
+		is_active: bool = True,
+		created_at: datetime | None = None,
+		deadline_hours: int | None = None,
+	) -> Workflow:
+		workflow = Workflow(
+			tenant_id=tenant.id,
+			name=name,
+			is_active=is_active,
+			created_by=user.id,
+		)
+		if created_at is not None:
+			workflow.created_at = created_at
+		db_session.add(workflow)
+		await db_session.flush()
+
+		for order in range(steps):
+			db_session.add(WorkflowStep(
+				workflow_id=workflow.id,
+				name=f"Step {order + 1}",
+				step_type=StepType.APPROVAL.value,
+				step_order=order,
+				assignee_type="user",
+				assignee_id=user.id,
+				deadline_hours=deadline_hours,
+			))
+		await db_session.commit()
+
+		return workflow
+
+	return _maker
+
+
+@pytest.fixture()
+async def document(make_document, user: orm.User):
+	return await make_document(
+		title="invoice.pdf", user=user, parent=user.home_folder
+	)
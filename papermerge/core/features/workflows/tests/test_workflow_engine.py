@@ -0,0 +1,224 @@
+# (c) Copyright Datacraft, 2026
+import uuid
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from papermerge.core import orm
+from papermerge.core.services.workflow_engine import WorkflowEngine
+from papermerge.core.features.workflows.db.orm import (
+	WorkflowStep,
+	WorkflowInstance,
+	WorkflowStepExecution,
+	WorkflowStatus,
+	StepStatus,
+)
+
+
+async def _steps(db_session: AsyncSession, workflow) -> list[WorkflowStep]:
+	stmt = select(WorkflowStep).where(
+		WorkflowStep.workflow_id == workflow.id
+	).order_by(WorkflowStep.step_order)
+	return list(await db_session.scalars(stmt))
+
+
+async def test_start_workflow(
+	db_session: AsyncSession, make_workflow, document, user: orm.User
+):
+	workflow = await make_workflow(steps=2)
+	first, _ = await _steps(db_session, workflow)
+	engine = WorkflowEngine(db_session)
+
+	instance = await engine.start_workflow(
+		workflow.id, document.id, initiated_by=user.id
+	)
+
+	assert instance.status == WorkflowStatus.IN_PROGRESS.value
+	assert instance.current_step_id == first.id
+
+	tasks = await engine.get_pending_tasks(user.id)
+	assert [t.step_id for t in tasks] == [first.id]
+	assert tasks[0].instance_id == instance.id
+
+
+async def test_approve_advances_then_completes(
+	db_session: AsyncSession, make_workflow, document, user: orm.User
+):
+	workflow = await make_workflow(steps=2)
+	first, second = await _steps(db_session, workflow)
+	engine = WorkflowEngine(db_session)
+	instance = await engine.start_workflow(workflow.id, document.id)
+
+	[task] = await engine.get_pending_tasks(user.id)
+	instance = await engine.process_step_action(task.id, "approved", user.id)
+
+	assert instance.status == WorkflowStatus.IN_PROGRESS.value
+	assert instance.current_step_id == second.id
+	approved = await db_session.get(WorkflowStepExecution, task.id)
+	assert approved.status == StepStatus.APPROVED.value
+	assert approved.completed_at is not None
+
+	[task] = await engine.get_pending_tasks(user.id)
+	assert task.step_id == second.id
+	instance = await engine.process_step_action(task.id, "approved", user.id)
+
+	assert instance.status == WorkflowStatus.COMPLETED.value
+	assert instance.completed_at is not None
+	assert instance.current_step_id is None
+	assert await engine.get_pending_tasks(user.id) == []
+
+
+async def test_reject_finishes_workflow(
+	db_session: AsyncSession, make_workflow, document, user: orm.User
+):
+	workflow = await make_workflow(steps=2)
+	engine = WorkflowEngine(db_session)
+	await engine.start_workflow(workflow.id, document.id)
+	[task] = await engine.get_pending_tasks(user.id)
+
+	instance = await engine.process_step_action(
+		task.id, "rejected", user.id, comments="wrong vendor"
+	)
+
+	assert instance.status == WorkflowStatus.REJECTED.value
+	assert instance.completed_at is not None
+	context = await db_session.scalar(
+		select(WorkflowInstance.context).where(WorkflowInstance.id == instance.id)
+	)
+	assert context["rejection_reason"] == "wrong vendor"
+
+
+async def test_step_execution_times_are_loaded(
+	db_session: AsyncSession, make_workflow, document
+):
+	workflow = await make_workflow(steps=1, deadline_hours=4)
+	[step] = await _steps(db_session, workflow)
+	engine = WorkflowEngine(db_session)
+	instance = await engine.start_workflow(workflow.id, document.id)
+
+	execution = await engine._create_step_execution(instance.id, step)
+
+	assert execution.status == StepStatus.PENDING.value
+	assert execution.deadline_at - execution.started_at == timedelta(hours=4)
+
+
+async def test_return_appends_to_context(
+	db_session: AsyncSession, make_workflow, document, user: orm.User
+):
+	workflow = await make_workflow(steps=2)
+	first, _ = await _steps(db_session, workflow)
+	engine = WorkflowEngine(db_session)
+	instance = await engine.start_workflow(workflow.id, document.id)
+	[task] = await engine.get_pending_tasks(user.id)
+	await engine.process_step_action(task.id, "approved", user.id)
+
+	[task] = await engine.get_pending_tasks(user.id)
+	instance = await engine.process_step_action(
+		task.id, "returned", user.id, comments="fix totals"
+	)
+
+	assert instance.current_step_id == first.id
+	context = await db_session.scalar(
+		select(WorkflowInstance.context).where(WorkflowInstance.id == instance.id)
+	)
+	[entry] = context["returns"]
+	assert entry["step_id"] == str(first.id)
+	assert entry["comments"] == "fix totals"
+	assert entry["timestamp"]
+
+
+async def test_check_deadlines_escalates_overdue_steps(
+	db_session: AsyncSession, make_workflow, document, user: orm.User
+):
+	workflow = await make_workflow(steps=2, deadline_hours=4)
+	first, second = await _steps(db_session, workflow)
+	first.escalation_step_id = second.id
+	plain = await make_workflow(name="No escalation", steps=1)
+	engine = WorkflowEngine(db_session)
+	escalating = [
+		await engine.start_workflow(workflow.id, document.id) for _ in range(2)
+	]
+	untouched = await engine.start_workflow(plain.id, document.id)
+	await db_session.execute(
+		update(WorkflowStepExecution).values(
+			deadline_at=func.now() - timedelta(hours=1)
+		)
+	)
+	overdue = {
+		row.instance_id: row.id for row in await db_session.execute(
+			select(WorkflowStepExecution.instance_id, WorkflowStepExecution.id)
+		)
+	}
+
+	escalated = await engine.check_deadlines()
+
+	assert sorted(e.id for e in escalated) == sorted(
+		overdue[i.id] for i in escalating
+	)
+	statuses = dict((await db_session.execute(
+		select(WorkflowStepExecution.id, WorkflowStepExecution.status).where(
+			WorkflowStepExecution.id.in_(overdue.values())
+		)
+	)).all())
+	assert statuses == {
+		overdue[escalating[0].id]: StepStatus.ESCALATED.value,
+		overdue[escalating[1].id]: StepStatus.ESCALATED.value,
+		overdue[untouched.id]: StepStatus.PENDING.value,
+	}
+
+	new_executions = (await db_session.execute(
+		select(WorkflowStepExecution).where(
+			WorkflowStepExecution.id.not_in(overdue.values())
+		)
+	)).scalars().all()
+	assert sorted(e.instance_id for e in new_executions) == sorted(
+		i.id for i in escalating
+	)
+	for execution in new_executions:
+		assert execution.step_id == second.id
+		assert execution.status == StepStatus.PENDING.value
+		assert execution.started_at is not None
+		assert execution.deadline_at - execution.started_at == timedelta(hours=4)
+
+	current_steps = dict((await db_session.execute(
+		select(WorkflowInstance.id, WorkflowInstance.current_step_id)
+	)).all())
+	assert current_steps == {
+		escalating[0].id: second.id,
+		escalating[1].id: second.id,
+		untouched.id: untouched.current_step_id,
+	}
+
+
+async def test_cancel_workflow(
+	db_session: AsyncSession, make_workflow, document, user: orm.User
+):
+	workflow = await make_workflow(steps=2)
+	engine = WorkflowEngine(db_session)
+	instance = await engine.start_workflow(workflow.id, document.id)
+
+	cancelled = await engine.cancel_workflow(
+		instance.id, user.id, reason="duplicate"
+	)
+
+	assert cancelled.status == WorkflowStatus.CANCELLED.value
+	assert cancelled.completed_at is not None
+	executions = await db_session.scalars(
+		select(WorkflowStepExecution.status).where(
+			WorkflowStepExecution.instance_id == instance.id
+		)
+	)
+	assert list(executions) == [StepStatus.SKIPPED.value]
+	assert await engine.get_pending_tasks(user.id) == []
+
+	with pytest.raises(ValueError, match="already finished"):
+		await engine.cancel_workflow(instance.id, user.id)
+
+
+async def test_cancel_unknown_workflow(db_session: AsyncSession, user: orm.User):
+	engine = WorkflowEngine(db_session)
+
+	with pytest.raises(ValueError, match="not found"):
+		await engine.cancel_workflow(uuid.uuid4(), user.id)
@@ -0,0 +1,144 @@
+# (c) Copyright Datacraft, 2026
+from papermerge.core.tests.types import AuthTestClient
+from papermerge.core.utils.tz import utc_now
+
+
+async def test_list_workflows_page_past_end_keeps_total(
+	auth_api_client: AuthTestClient, make_workflow
+):
+	for name in ("a", "b", "c"):
+		await make_workflow(name=name)
+
+	response = await auth_api_client.get(
+		"/workflows/", params={"page": 5, "page_size": 2}
+	)
+
+	assert response.status_code == 200, response.json()
+	data = response.json()
+	assert data["items"] == []
+	assert data["total"] == 3
+	assert data["has_more"] is False
+
+
+async def test_list_workflows_cursor_does_not_skip_equal_timestamps(
+	auth_api_client: AuthTestClient, make_workflow
+):
+	created_at = utc_now()
+	expected = set()
+	for name in ("a", "b", "c"):
+		workflow = await make_workflow(name=name, created_at=created_at)
+		expected.add(str(workflow.id))
+
+	response = await auth_api_client.get(
+		"/workflows/", params={"page_size": 2}
+	)
+	first = response.json()
+	assert first["has_more"] is True
+	assert first["next_cursor"] is not None
+
+	response = await auth_api_client.get(
+		"/workflows/",
+		params={
+			"page_size": 2,
+			"cursor": first["next_cursor"],
+			"cursor_id": first["next_cursor_id"],
+		},
+	)
+
+	assert response.status_code == 200, response.json()
+	second = response.json()
+	assert second["page"] is None
+	assert second["total"] is None
+	assert second["has_more"] is False
+	assert second["next_cursor"] is None
+	seen = [w["id"] for w in first["items"] + second["items"]]
+	assert len(seen) == 3
+	assert set(seen) == expected
+
+
+async def test_list_workflows_cursor_requires_cursor_id(
+	auth_api_client: AuthTestClient, make_workflow
+):
+	await make_workflow()
+
+	response = await auth_api_client.get(
+		"/workflows/", params={"cursor": utc_now().isoformat()}
+	)
+
+	assert response.status_code == 400
+
+
+async def test_list_workflows_without_count_uses_has_more(
+	auth_api_client: AuthTestClient, make_workflow
+):
+	for name in ("a", "b", "c"):
+		await make_workflow(name=name)
+
+	response = await auth_api_client.get(
+		"/workflows/", params={"page_size": 2, "count": False}
+	)
+
+	assert response.status_code == 200, response.json()
+	data = response.json()
+	assert data["total"] is None
+	assert len(data["items"]) == 2
+	assert data["has_more"] is True
+
+	response = await auth_api_client.get(
+		"/workflows/", params={"page": 2, "page_size": 2, "count": False}
+	)
+
+	data = response.json()
+	assert len(data["items"]) == 1
+	assert data["has_more"] is False
+
+
+async def test_list_workflows_last_page(
+	auth_api_client: AuthTestClient, make_workflow
+):
+	for name in ("a", "b", "c"):
+		await make_workflow(name=name)
+	await make_workflow(name="inactive", is_active=False)
+
+	response = await auth_api_client.get(
+		"/workflows/", params={"page": 2, "page_size": 2}
+	)
+
+	assert response.status_code == 200, response.json()
+	data = response.json()
+	assert len(data["items"]) == 1
+	assert data["total"] == 3
+	assert data["page"] == 2
+	assert data["has_more"] is False
+	assert data["next_cursor"] is None
+
+
+async def test_pending_tasks_are_paged(
+	auth_api_client: AuthTestClient, make_workflow, document
+):
+	workflow = await make_workflow()
+	for _ in range(3):
+		response = await auth_api_client.post(
+			f"/workflows/{workflow.id}/start",
+			json={"document_id": str(document.id)},
+		)
+		assert response.status_code == 200, response.json()
+
+	response = await auth_api_client.get(
+		"/workflows/instances/pending", params={"page_size": 2}
+	)
+
+	assert response.status_code == 200, response.json()
+	first = response.json()
+	assert len(first["tasks"]) == 2
+	assert first["has_more"] is True
+
+	response = await auth_api_client.get(
+		"/workflows/instances/pending", params={"page": 2, "page_size": 2}
+	)
+
+	second = response.json()
+	assert len(second["tasks"]) == 1
+	assert second["has_more"] is False
+	ids = {t["id"] for t in first["tasks"] + second["tasks"]}
+	assert len(ids) == 3
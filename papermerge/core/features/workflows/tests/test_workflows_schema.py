@@ -0,0 +1,49 @@
+# (c) Copyright Datacraft, 2026
+import uuid
+
+from papermerge.core.utils.tz import utc_now
+from papermerge.core.features.workflows import schema
+from papermerge.core.features.workflows.db.orm import (
+	Workflow,
+	WorkflowInstance,
+)
+
+
+def test_from_orm_fast_reads_columns_only():
+	workflow = Workflow(
+		id=uuid.uuid4(), name="Invoices", is_active=True, created_at=utc_now()
+	)
+
+	detail = schema.from_orm_fast(schema.WorkflowDetail, workflow)
+
+	assert detail.id == workflow.id
+	assert detail.name == "Invoices"
+	assert detail.description is None
+	# relationship is not read; the schema default applies
+	assert detail.steps == []
+
+
+def test_from_orm_fast_does_not_share_mutable_defaults():
+	make = lambda: Workflow(id=uuid.uuid4(), name="w", is_active=True)
+
+	first = schema.from_orm_fast(schema.WorkflowDetail, make())
+	second = schema.from_orm_fast(schema.WorkflowDetail, make())
+	first.steps.append(None)
+
+	assert second.steps == []
+
+
+def test_from_orm_fast_defaults_fields_missing_on_row():
+	instance = WorkflowInstance(
+		id=uuid.uuid4(),
+		workflow_id=uuid.uuid4(),
+		document_id=uuid.uuid4(),
+		status="in_progress",
+	)
+
+	info = schema.from_orm_fast(schema.WorkflowInstanceInfo, instance)
+
+	assert info.document_id == instance.document_id
+	# WorkflowInstance has no created_at column
+	assert info.created_at is None
+	assert "created_at" not in info.model_fields_set
@@ -104,11 +104,12 @@ class EmbeddingService(ABC):
 
 			# Try to break at sentence boundary
 			if end < len(text):
-				# Look for sentence end
+				# Look for sentence end; search the window in place rather
+				# than copying it out for every separator
 				for sep in ['. ', '! ', '? ', '\n\n', '\n']:
-					last_sep = text[start:end].rfind(sep)
-					if last_sep > chunk_size // 2:
-						end = start + last_sep + len(sep)
+					last_sep = text.rfind(sep, start, end)
+					if last_sep - start > chunk_size // 2:
+						end = last_sep + len(sep)
 						break
 
 			chunk = text[start:end].strip()
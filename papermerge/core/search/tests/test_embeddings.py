@@ -0,0 +1,80 @@
+import pytest
+
+from papermerge.core.search.embeddings.service import (
+	EmbeddingResult,
+	EmbeddingService,
+)
+
+
+class _Service(EmbeddingService):
+	async def embed_text(self, text: str) -> EmbeddingResult:
+		raise NotImplementedError
+
+	async def embed_texts(self, texts: list[str]) -> list[EmbeddingResult]:
+		raise NotImplementedError
+
+	async def embed_query(self, query: str) -> EmbeddingResult:
+		raise NotImplementedError
+
+	def get_dimension(self) -> int:
+		return 0
+
+	def get_model_name(self) -> str:
+		return "test"
+
+	async def is_available(self) -> bool:
+		return False
+
+
+@pytest.fixture
+def service() -> EmbeddingService:
+	return _Service()
+
+
+def test_chunk_text_short_text(service):
+	assert service.chunk_text("short", chunk_size=20) == ["short"]
+
+
+def test_chunk_text_separator_at_half_window_is_ignored(service):
+	# ". " starts exactly at chunk_size // 2: too early to break on
+	text = "a" * 10 + ". " + "b" * 20
+
+	chunks = service.chunk_text(text, chunk_size=20, overlap=5)
+
+	assert chunks[0] == text[:20]
+
+
+def test_chunk_text_breaks_after_separator_past_half_window(service):
+	text = "a" * 11 + ". " + "b" * 20
+
+	chunks = service.chunk_text(text, chunk_size=20, overlap=5)
+
+	assert chunks[0] == "a" * 11 + "."
+	assert chunks[1] == "a" * 3 + ". " + "b" * 15
+
+
+def test_chunk_text_separator_must_fit_in_window(service):
+	# ". " straddles the window end, so it is not a break candidate
+	text = "a" * 19 + ". " + "b" * 20
+
+	chunks = service.chunk_text(text, chunk_size=20, overlap=5)
+
+	# A hard split at 20 means the next window starts at 15, not 16
+	assert chunks[1] == "a" * 4 + ". " + "b" * 14
+
+
+def test_chunk_text_separator_in_later_window(service):
+	text = "a" * 30 + ". " + "b" * 30
+
+	chunks = service.chunk_text(text, chunk_size=20, overlap=5)
+
+	# The second window starts at 15; its break is measured from there
+	assert chunks[:2] == ["a" * 20, "a" * 15 + "."]
+
+
+def test_chunk_text_without_separator_splits_hard(service):
+	text = "x" * 50
+
+	chunks = service.chunk_text(text, chunk_size=20, overlap=5)
+
+	assert chunks == ["x" * 20, "x" * 20, "x" * 20, "x" * 5]
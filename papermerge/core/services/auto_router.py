@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 from sqlalchemy import select, and_
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from papermerge.core.features.routing.db.orm import RoutingRule, RoutingLog
 
@@ -37,7 +37,7 @@ class RoutingResult:
 class AutoRouterService:
 	"""Route documents based on metadata and rules."""
 
-	def __init__(self, db: Session):
+	def __init__(self, db: AsyncSession):
 		self.db = db
 
 	async def route_document(
@@ -60,7 +60,7 @@ class AutoRouterService:
 			)
 		).order_by(RoutingRule.priority)
 
-		rules = list(self.db.scalars(stmt))
+		rules = list(await self.db.scalars(stmt))
 
 		for rule in rules:
 			if self._matches_conditions(document_data, rule.conditions):
@@ -198,24 +198,27 @@ class AutoRouterService:
 	async def _move_to_folder(self, document_id: UUID, folder_id: UUID) -> None:
 		"""Move document to folder."""
 		from papermerge.core.features.nodes.db.orm import Node
-		node = self.db.get(Node, document_id)
+		node = await self.db.get(Node, document_id)
 		if node:
 			node.parent_id = folder_id
-			self.db.commit()
+			await self.db.commit()
 
 	async def _route_to_inbox(self, document_id: UUID, user_id: UUID) -> None:
 		"""Route document to user's inbox."""
 		from papermerge.core.features.users.db.orm import User
-		user = self.db.get(User, user_id)
+		user = await self.db.get(User, user_id)
 		if user and user.inbox_folder_id:
 			await self._move_to_folder(document_id, user.inbox_folder_id)
 
 	async def _get_document_data(self, document_id: UUID) -> dict:
 		"""Get document data for routing evaluation."""
 		from papermerge.core.features.document.db.orm import Document
-		from papermerge.core.features.custom_fields.db.orm import CustomFieldValue
+		from papermerge.core.features.custom_fields.db.orm import (
+			CustomField,
+			CustomFieldValue,
+		)
 
-		doc = self.db.get(Document, document_id)
+		doc = await self.db.get(Document, document_id)
 		if not doc:
 			return {}
 
@@ -228,11 +231,13 @@ class AutoRouterService:
 		}
 
 		# Get custom field values
-		stmt = select(CustomFieldValue).where(
+		stmt = select(CustomField.name, CustomFieldValue.value).join(
+			CustomField, CustomField.id == CustomFieldValue.field_id
+		).where(
 			CustomFieldValue.document_id == document_id
 		)
-		for cfv in self.db.scalars(stmt):
-			data["metadata"][cfv.custom_field.name] = cfv.value
+		for name, value in await self.db.execute(stmt):
+			data["metadata"][name] = value
 
 		return data
 
@@ -259,4 +264,4 @@ class AutoRouterService:
 			evaluated_conditions=conditions,
 		)
 		self.db.add(log)
-		self.db.commit()
+		await self.db.commit()
@@ -2,10 +2,12 @@
 """Workflow engine for document approval and routing."""
 import logging
 from uuid import UUID
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 
-from sqlalchemy import select, and_
-from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, update, and_, func, cast
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, contains_eager
 
 from papermerge.core.features.workflows.db.orm import (
 	Workflow,
@@ -18,11 +20,31 @@ from papermerge.core.features.workflows.db.orm import (
 
 logger = logging.getLogger(__name__)
 
+_FINISHED_STATUSES = frozenset({
+	WorkflowStatus.COMPLETED.value,
+	WorkflowStatus.CANCELLED.value,
+})
+
+
+def _merge_context(patch):
+	"""Server-side ``coalesce(context, '{}') || patch`` for JSONB updates.
+
+	Lets state changes write into the instance context without loading and
+	re-serializing the whole document in Python.
+	"""
+	if isinstance(patch, dict):
+		patch = cast(patch, JSONB)
+	return func.coalesce(
+		WorkflowInstance.context, cast({}, JSONB)
+	).op("||", return_type=JSONB)(patch)
+
 
 class WorkflowEngine:
 	"""Workflow execution engine."""
 
-	def __init__(self, db: Session):
+	__slots__ = ("db",)
+
+	def __init__(self, db: AsyncSession):
 		self.db = db
 
 	async def start_workflow(
@@ -33,7 +55,7 @@ class WorkflowEngine:
 		context: dict | None = None,
 	) -> WorkflowInstance:
 		"""Start a new workflow instance."""
-		workflow = self.db.get(Workflow, workflow_id)
+		workflow = await self.db.get(Workflow, workflow_id)
 		if not workflow:
 			raise ValueError(f"Workflow not found: {workflow_id}")
 
@@ -44,22 +66,22 @@ class WorkflowEngine:
 		if not first_step:
 			raise ValueError(f"Workflow has no steps: {workflow_id}")
 
-		instance = WorkflowInstance(
-			workflow_id=workflow_id,
-			document_id=document_id,
-			current_step_id=first_step.id,
-			status=WorkflowStatus.IN_PROGRESS.value,
-			initiated_by=initiated_by,
-			context=context or {},
+		# RETURNING hands back the fully populated row, no refresh needed
+		instance = await self.db.scalar(
+			insert(WorkflowInstance).values(
+				workflow_id=workflow_id,
+				document_id=document_id,
+				current_step_id=first_step.id,
+				status=WorkflowStatus.IN_PROGRESS.value,
+				initiated_by=initiated_by,
+				context=context or {},
+			).returning(WorkflowInstance)
 		)
-		self.db.add(instance)
-		self.db.flush()
 
 		# Create first step execution
 		await self._create_step_execution(instance.id, first_step)
 
-		self.db.commit()
-		self.db.refresh(instance)
+		await self.db.commit()
 
 		logger.info(f"Started workflow {workflow_id} for document {document_id}")
 		return instance
@@ -72,25 +94,33 @@ class WorkflowEngine:
 		comments: str | None = None,
 	) -> WorkflowInstance:
 		"""Process user action on a workflow step."""
-		execution = self.db.get(WorkflowStepExecution, execution_id)
+		execution = await self.db.get(WorkflowStepExecution, execution_id)
 		if not execution:
 			raise ValueError(f"Execution not found: {execution_id}")
 
 		if execution.status != StepStatus.PENDING.value:
 			raise ValueError(f"Execution is not pending: {execution_id}")
 
-		step = self.db.get(WorkflowStep, execution.step_id)
-		instance = self.db.get(WorkflowInstance, execution.instance_id)
+		step = await self.db.get(WorkflowStep, execution.step_id)
+		instance = await self.db.get(WorkflowInstance, execution.instance_id)
 
 		# Verify assignment
 		if execution.assigned_to and execution.assigned_to != user_id:
 			raise ValueError("User is not assigned to this step")
 
-		# Update execution
-		execution.status = action
-		execution.action_taken = action
-		execution.comments = comments
-		execution.completed_at = datetime.now(timezone.utc)
+		# Update execution; completed_at comes from the database clock so all
+		# workers agree, and RETURNING loads it back onto execution
+		await self.db.scalar(
+			update(WorkflowStepExecution)
+			.where(WorkflowStepExecution.id == execution_id)
+			.values(
+				status=action,
+				action_taken=action,
+				comments=comments,
+				completed_at=func.now(),
+			)
+			.returning(WorkflowStepExecution)
+		)
 
 		# Determine next step
 		if action == "approved":
@@ -114,33 +144,71 @@ class WorkflowEngine:
 			# Forward to another user - create new execution
 			pass
 
-		self.db.commit()
-		self.db.refresh(instance)
+		# Session does not expire on commit; instance already holds the
+		# values written above
+		await self.db.commit()
 
 		logger.info(f"Processed action {action} on execution {execution_id}")
 		return instance
 
 	async def check_deadlines(self) -> list[WorkflowStepExecution]:
 		"""Check for overdue steps and escalate."""
-		now = datetime.now(timezone.utc)
-		stmt = select(WorkflowStepExecution).where(
-			and_(
-				WorkflowStepExecution.status == StepStatus.PENDING.value,
-				WorkflowStepExecution.deadline_at < now,
+		# Only executions whose step can escalate are fetched; the step
+		# rides along on the same row via the join
+		stmt = (
+			select(WorkflowStepExecution)
+			.join(WorkflowStepExecution.step)
+			.options(
+				contains_eager(WorkflowStepExecution.step),
+				raiseload("*"),
+			)
+			.where(
+				and_(
+					WorkflowStepExecution.status == StepStatus.PENDING.value,
+					WorkflowStepExecution.deadline_at < func.now(),
+					WorkflowStep.escalation_step_id.is_not(None),
+				)
 			)
 		)
-		overdue = list(self.db.scalars(stmt))
+		escalated = list(await self.db.scalars(stmt))
+		if not escalated:
+			return escalated
+
+		# Resolve escalation targets and owning instances for the whole
+		# batch in two queries instead of two lookups per execution
+		escalation_steps = {
+			s.id: s for s in await self.db.scalars(
+				select(WorkflowStep).where(WorkflowStep.id.in_(
+					{e.step.escalation_step_id for e in escalated}
+				))
+			)
+		}
+		instances = {
+			i.id: i for i in await self.db.scalars(
+				select(WorkflowInstance).where(WorkflowInstance.id.in_(
+					{e.instance_id for e in escalated}
+				))
+			)
+		}
+
+		new_executions = []
+		for execution in escalated:
+			values = self._escalate_step(
+				execution,
+				escalation_steps.get(execution.step.escalation_step_id),
+				instances[execution.instance_id],
+			)
+			if values:
+				new_executions.append(values)
 
-		escalated = []
-		for execution in overdue:
-			step = self.db.get(WorkflowStep, execution.step_id)
-			if step.escalation_step_id:
-				await self._escalate_step(execution, step)
-				escalated.append(execution)
+		# One multi-row INSERT for every escalation execution of this pass
+		if new_executions:
+			await self.db.execute(
+				insert(WorkflowStepExecution).values(new_executions)
+			)
 
-		if escalated:
-			self.db.commit()
-			logger.info(f"Escalated {len(escalated)} overdue workflow steps")
+		await self.db.commit()
+		logger.info(f"Escalated {len(escalated)} overdue workflow steps")
 
 		return escalated
 
@@ -148,15 +216,32 @@ class WorkflowEngine:
 		self,
 		user_id: UUID,
 		tenant_id: UUID | None = None,
+		limit: int | None = None,
+		offset: int = 0,
 	) -> list[WorkflowStepExecution]:
-		"""Get pending tasks for a user."""
-		stmt = select(WorkflowStepExecution).where(
-			and_(
-				WorkflowStepExecution.status == StepStatus.PENDING.value,
-				WorkflowStepExecution.assigned_to == user_id,
+		"""Get pending tasks for a user, newest first.
+
+		Relationships are not loaded; accessing one raises instead of
+		silently issuing a query per row.
+		"""
+		stmt = (
+			select(WorkflowStepExecution)
+			.options(raiseload("*"))
+			.where(
+				and_(
+					WorkflowStepExecution.status == StepStatus.PENDING.value,
+					WorkflowStepExecution.assigned_to == user_id,
+				)
+			)
+			# id breaks created_at ties so offset pages are stable
+			.order_by(
+				WorkflowStepExecution.created_at.desc(),
+				WorkflowStepExecution.id.desc(),
 			)
+			.offset(offset)
+			.limit(limit)
 		)
-		return list(self.db.scalars(stmt))
+		return list(await self.db.scalars(stmt))
 
 	async def cancel_workflow(
 		self,
@@ -165,31 +250,45 @@ class WorkflowEngine:
 		reason: str | None = None,
 	) -> WorkflowInstance:
 		"""Cancel a running workflow."""
-		instance = self.db.get(WorkflowInstance, instance_id)
-		if not instance:
-			raise ValueError(f"Workflow instance not found: {instance_id}")
-
-		if instance.status in [WorkflowStatus.COMPLETED.value, WorkflowStatus.CANCELLED.value]:
+		# The status guard lives in the WHERE clause so a concurrent
+		# completion cannot be overwritten between a read and the write
+		instance = await self.db.scalar(
+			update(WorkflowInstance)
+			.where(
+				WorkflowInstance.id == instance_id,
+				WorkflowInstance.status.not_in(_FINISHED_STATUSES),
+			)
+			.values(
+				status=WorkflowStatus.CANCELLED.value,
+				completed_at=func.now(),
+				context=_merge_context({
+					"cancellation_reason": reason,
+					"cancelled_by": str(user_id),
+				}),
+			)
+			.returning(WorkflowInstance)
+		)
+		if instance is None:
+			exists = await self.db.scalar(
+				select(WorkflowInstance.id).where(WorkflowInstance.id == instance_id)
+			)
+			if exists is None:
+				raise ValueError(f"Workflow instance not found: {instance_id}")
 			raise ValueError("Workflow already finished")
 
-		instance.status = WorkflowStatus.CANCELLED.value
-		instance.completed_at = datetime.now(timezone.utc)
-		instance.context = instance.context or {}
-		instance.context["cancellation_reason"] = reason
-		instance.context["cancelled_by"] = str(user_id)
-
 		# Mark pending executions as skipped
-		stmt = select(WorkflowStepExecution).where(
-			and_(
-				WorkflowStepExecution.instance_id == instance_id,
-				WorkflowStepExecution.status == StepStatus.PENDING.value,
+		await self.db.execute(
+			update(WorkflowStepExecution)
+			.where(
+				and_(
+					WorkflowStepExecution.instance_id == instance_id,
+					WorkflowStepExecution.status == StepStatus.PENDING.value,
+				)
 			)
+			.values(status=StepStatus.SKIPPED.value)
 		)
-		for execution in self.db.scalars(stmt):
-			execution.status = StepStatus.SKIPPED.value
 
-		self.db.commit()
-		self.db.refresh(instance)
+		await self.db.commit()
 
 		logger.info(f"Cancelled workflow instance {instance_id}")
 		return instance
@@ -198,8 +297,8 @@ class WorkflowEngine:
 		"""Get the first step of a workflow."""
 		stmt = select(WorkflowStep).where(
 			WorkflowStep.workflow_id == workflow_id
-		).order_by(WorkflowStep.step_order)
-		return self.db.scalar(stmt)
+		).order_by(WorkflowStep.step_order).limit(1)
+		return await self.db.scalar(stmt)
 
 	async def _get_next_step(self, step: WorkflowStep) -> WorkflowStep | None:
 		"""Get the next step after the current one."""
@@ -208,8 +307,8 @@ class WorkflowEngine:
 				WorkflowStep.workflow_id == step.workflow_id,
 				WorkflowStep.step_order > step.step_order,
 			)
-		).order_by(WorkflowStep.step_order)
-		return self.db.scalar(stmt)
+		).order_by(WorkflowStep.step_order).limit(1)
+		return await self.db.scalar(stmt)
 
 	async def _get_previous_step(self, step: WorkflowStep) -> WorkflowStep | None:
 		"""Get the previous step."""
@@ -218,8 +317,8 @@ class WorkflowEngine:
 				WorkflowStep.workflow_id == step.workflow_id,
 				WorkflowStep.step_order < step.step_order,
 			)
-		).order_by(WorkflowStep.step_order.desc())
-		return self.db.scalar(stmt)
+		).order_by(WorkflowStep.step_order.desc()).limit(1)
+		return await self.db.scalar(stmt)
 
 	async def _create_step_execution(
 		self,
@@ -227,9 +326,26 @@ class WorkflowEngine:
 		step: WorkflowStep,
 	) -> WorkflowStepExecution:
 		"""Create execution record for a step."""
+		# RETURNING loads the database-stamped started_at/deadline_at
+		execution = await self.db.scalar(
+			insert(WorkflowStepExecution)
+			.values(**self._step_execution_values(instance_id, step))
+			.returning(WorkflowStepExecution)
+		)
+
+		# TODO: Send notification to assignee
+
+		return execution
+
+	def _step_execution_values(
+		self,
+		instance_id: UUID,
+		step: WorkflowStep,
+	) -> dict:
+		"""Column values for a new pending execution of ``step``."""
 		deadline_at = None
 		if step.deadline_hours:
-			deadline_at = datetime.now(timezone.utc) + timedelta(hours=step.deadline_hours)
+			deadline_at = func.now() + timedelta(hours=step.deadline_hours)
 
 		# Determine assignee
 		assigned_to = None
@@ -237,20 +353,14 @@ class WorkflowEngine:
 			assigned_to = step.assignee_id
 		# TODO: Handle role/group/dynamic assignment
 
-		execution = WorkflowStepExecution(
-			instance_id=instance_id,
-			step_id=step.id,
-			status=StepStatus.PENDING.value,
-			assigned_to=assigned_to,
-			started_at=datetime.now(timezone.utc),
-			deadline_at=deadline_at,
-		)
-		self.db.add(execution)
-		self.db.flush()
-
-		# TODO: Send notification to assignee
-
-		return execution
+		return {
+			"instance_id": instance_id,
+			"step_id": step.id,
+			"status": StepStatus.PENDING.value,
+			"assigned_to": assigned_to,
+			"started_at": func.now(),
+			"deadline_at": deadline_at,
+		}
 
 	async def _advance_to_step(
 		self,
@@ -263,9 +373,17 @@ class WorkflowEngine:
 
 	async def _complete_workflow(self, instance: WorkflowInstance) -> None:
 		"""Mark workflow as completed."""
-		instance.status = WorkflowStatus.COMPLETED.value
-		instance.completed_at = datetime.now(timezone.utc)
-		instance.current_step_id = None
+		# RETURNING refreshes instance with the database-stamped completed_at
+		await self.db.scalar(
+			update(WorkflowInstance)
+			.where(WorkflowInstance.id == instance.id)
+			.values(
+				status=WorkflowStatus.COMPLETED.value,
+				completed_at=func.now(),
+				current_step_id=None,
+			)
+			.returning(WorkflowInstance)
+		)
 
 		logger.info(f"Completed workflow instance {instance.id}")
 
@@ -275,10 +393,16 @@ class WorkflowEngine:
 		reason: str | None,
 	) -> None:
 		"""Mark workflow as rejected."""
-		instance.status = WorkflowStatus.REJECTED.value
-		instance.completed_at = datetime.now(timezone.utc)
-		instance.context = instance.context or {}
-		instance.context["rejection_reason"] = reason
+		await self.db.scalar(
+			update(WorkflowInstance)
+			.where(WorkflowInstance.id == instance.id)
+			.values(
+				status=WorkflowStatus.REJECTED.value,
+				completed_at=func.now(),
+				context=_merge_context({"rejection_reason": reason}),
+			)
+			.returning(WorkflowInstance)
+		)
 
 		logger.info(f"Rejected workflow instance {instance.id}")
 
@@ -291,29 +415,37 @@ class WorkflowEngine:
 		"""Return workflow to a previous step."""
 		instance.current_step_id = step.id
 		await self._create_step_execution(instance.id, step)
-		# Add return comments to context
-		instance.context = instance.context or {}
-		if "returns" not in instance.context:
-			instance.context["returns"] = []
-		instance.context["returns"].append({
-			"step_id": str(step.id),
-			"comments": comments,
-			"timestamp": datetime.now(timezone.utc).isoformat(),
-		})
-
-	async def _escalate_step(
+		# Append return comments to context["returns"]
+		returns = func.coalesce(
+			WorkflowInstance.context["returns"], cast([], JSONB)
+		).op("||", return_type=JSONB)(func.jsonb_build_array(
+			func.jsonb_build_object(
+				"step_id", str(step.id),
+				"comments", comments,
+				"timestamp", func.now(),
+			)
+		))
+		instance.context = _merge_context(
+			func.jsonb_build_object("returns", returns)
+		)
+
+	def _escalate_step(
 		self,
 		execution: WorkflowStepExecution,
-		step: WorkflowStep,
-	) -> None:
-		"""Escalate an overdue step."""
+		escalation_step: WorkflowStep | None,
+		instance: WorkflowInstance,
+	) -> dict | None:
+		"""Escalate an overdue step.
+
+		Returns the values of the escalation step's new execution, for the
+		caller to insert together with the rest of the batch.
+		"""
 		execution.status = StepStatus.ESCALATED.value
 
-		# Create execution for escalation step
-		escalation_step = self.db.get(WorkflowStep, step.escalation_step_id)
+		values = None
 		if escalation_step:
-			instance = self.db.get(WorkflowInstance, execution.instance_id)
 			instance.current_step_id = escalation_step.id
-			await self._create_step_execution(instance.id, escalation_step)
+			values = self._step_execution_values(instance.id, escalation_step)
 
 		logger.info(f"Escalated step execution {execution.id}")
+		return values